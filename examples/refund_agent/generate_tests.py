@@ -416,7 +416,7 @@ if __name__ == "__main__":
 
     # Save to JSON file
     with open("test_cases.json", "w") as f:
-        json.dump(test_cases, f, indent=2)
+        f.write(json.dumps(test_cases, indent=2))
 
     print(f"Generated {len(test_cases)} test cases")
 
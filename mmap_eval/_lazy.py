@@ -0,0 +1,33 @@
+"""Helpers for packages that import their public classes on first access."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], modules: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build PEP 562 ``__getattr__`` and ``__dir__`` hooks for a package.
+
+    Args:
+        namespace: The package's ``globals()``; must already define ``__all__``
+        modules: Exported name -> module that defines it
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) to assign at package level
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_path = modules.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_path), name)
+        # Cache on the package so later lookups skip __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace["__all__"]))
+
+    return __getattr__, __dir__
@@ -8,8 +8,6 @@ import typer
 from rich.console import Console
 
 from mmap_eval import __version__
-from mmap_eval.reporters.json_reporter import JSONReporter
-from mmap_eval.reporters.terminal_reporter import TerminalReporter
 
 app = typer.Typer(
     name="mmap",
@@ -62,8 +60,7 @@ def init(
     ]
 
     test_file = project_dir / "tests" / "test_cases.json"
-    with open(test_file, "w") as f:
-        json.dump(test_template, f, indent=2)
+    test_file.write_text(json.dumps(test_template, indent=2))
 
     # Create template agent file
     agent_template = '''"""Sample agent implementation."""
@@ -87,8 +84,7 @@ def my_agent(input_data):
 '''
 
     agent_file = project_dir / "agent.py"
-    with open(agent_file, "w") as f:
-        f.write(agent_template)
+    agent_file.write_text(agent_template)
 
     # Create template evaluation script
     eval_template = '''"""Evaluation script for the agent."""
@@ -134,8 +130,7 @@ if __name__ == "__main__":
 '''
 
     eval_file = project_dir / "evaluate.py"
-    with open(eval_file, "w") as f:
-        f.write(eval_template)
+    eval_file.write_text(eval_template)
 
     # Create README
     readme_content = f"""# {name} - MMAP Evaluation Project
@@ -182,8 +177,7 @@ evaluator.add_metric(HallucinationDetection(threshold=0.9))
 """
 
     readme_file = project_dir / "README.md"
-    with open(readme_file, "w") as f:
-        f.write(readme_content)
+    readme_file.write_text(readme_content)
 
     console.print(f"[green]✓ Created MMAP project: {project_dir}[/green]")
     console.print("\nNext steps:")
@@ -204,6 +198,10 @@ def report(
         result_file: Path to evaluation result JSON file
         detailed: Whether to show detailed metrics
     """
+    # Imported here so other commands don't pay for loading the reporters
+    from mmap_eval.reporters.json_reporter import JSONReporter
+    from mmap_eval.reporters.terminal_reporter import TerminalReporter
+
     try:
         result = JSONReporter.load(result_file)
         reporter = TerminalReporter()
@@ -1,16 +1,65 @@
 """Main agent evaluator orchestrator."""
 
+import asyncio
+import inspect
+import os
 import time
 import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult
 from mmap_eval.core.registry import MetricRegistry
 from mmap_eval.core.result import EvaluationResult, LayerResult
 from mmap_eval.core.test_loader import TestCase, TestLoader
 
 
+def _call_agent(
+    agent: Callable[[Dict[str, Any]], Any], agent_input: Dict[str, Any]
+) -> Tuple[Any, Optional[str]]:
+    """Run the agent on one input, capturing any error message.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Returns:
+        Tuple of (output, error), where error is None on success
+    """
+    try:
+        return agent(agent_input), None
+    except Exception as e:
+        return None, str(e)
+
+
+async def _call_agent_async(
+    agent: Callable[[Dict[str, Any]], Any], agent_input: Dict[str, Any]
+) -> Tuple[Any, Optional[str]]:
+    """Await the agent on one input, capturing any error message.
+
+    Async agents (coroutine functions or objects with an async ``__call__``)
+    are awaited directly. Synchronous agents are run in the event loop's
+    default executor so they don't block other in-flight calls; if one still
+    returns an awaitable (e.g. a partial wrapping a coroutine function), it is
+    awaited too.
+
+    Returns:
+        Tuple of (output, error), where error is None on success
+    """
+    try:
+        if inspect.iscoroutinefunction(agent) or inspect.iscoroutinefunction(
+            getattr(type(agent), "__call__", None)
+        ):
+            return await agent(agent_input), None
+        loop = asyncio.get_running_loop()
+        output = await loop.run_in_executor(None, agent, agent_input)
+        if inspect.isawaitable(output):
+            output = await output
+        return output, None
+    except Exception as e:
+        return None, str(e)
+
+
 class AgentEvaluator:
     """Main evaluator for assessing AI agents across all 5 layers.
 
@@ -33,11 +82,16 @@ class AgentEvaluator:
         5: "Fairness & Compliance",
     }
 
+    # Maximum concurrent agent calls in evaluate_async when max_workers is not set
+    DEFAULT_ASYNC_CONCURRENCY = 32
+
     def __init__(
         self,
         agent: Callable[[Dict[str, Any]], Any],
         test_dataset: Optional[Union[str, Path, List[Dict[str, Any]]]] = None,
         agent_id: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
     ):
         """Initialize the evaluator.
 
@@ -45,9 +99,16 @@ class AgentEvaluator:
             agent: Agent function to evaluate (takes input dict, returns output)
             test_dataset: Test dataset (file path or list of test cases)
             agent_id: Optional identifier for the agent
+            max_workers: Maximum number of workers for parallel evaluation
+                (uses the executor's default if not provided)
+            use_processes: Run the agent in worker processes instead of threads
+                during parallel evaluation (for CPU-bound agents; the agent must
+                be picklable, e.g. a module-level function)
         """
         self.agent = agent
         self.agent_id = agent_id or f"agent_{uuid.uuid4().hex[:8]}"
+        self.max_workers = max_workers
+        self.use_processes = use_processes
         self.registry = MetricRegistry()
         self.test_cases: List[TestCase] = []
 
@@ -60,10 +121,11 @@ class AgentEvaluator:
         """Load test dataset.
 
         Args:
-            test_dataset: File path or list of test case dictionaries
+            test_dataset: File path (JSON, or JSON Lines with a .jsonl extension)
+                or list of test case dictionaries
         """
         if isinstance(test_dataset, (str, Path)):
-            self.test_cases = TestLoader.load_from_json(test_dataset)
+            self.test_cases = TestLoader.load_from_file(test_dataset)
         elif isinstance(test_dataset, list):
             self.test_cases = TestLoader.load_from_list(test_dataset)
         else:
@@ -98,7 +160,8 @@ class AgentEvaluator:
 
         Args:
             test_cases: Optional test cases to use (uses loaded dataset if not provided)
-            parallel: Whether to run evaluations in parallel (not implemented yet)
+            parallel: Whether to run the agent on test cases concurrently in a
+                thread pool (or process pool if use_processes is set)
 
         Returns:
             EvaluationResult with complete evaluation data
@@ -108,8 +171,59 @@ class AgentEvaluator:
             ValueError: If no metrics registered
         """
         start_time = time.time()
-        evaluation_id = f"eval_{uuid.uuid4().hex}"
+        cases_to_evaluate = self._resolve_test_cases(test_cases)
+
+        # Run the agent once per test case; every layer scores the same outputs
+        if parallel:
+            with self._create_executor() as executor:
+                agent_results = self._run_agent(cases_to_evaluate, executor)
+        else:
+            agent_results = self._run_agent(cases_to_evaluate)
+
+        return self._build_result(cases_to_evaluate, agent_results, start_time)
+
+    async def evaluate_async(
+        self,
+        test_cases: Optional[List[TestCase]] = None,
+    ) -> EvaluationResult:
+        """Run the complete evaluation, awaiting agent calls concurrently.
+
+        Coroutine function agents (``async def``) are awaited directly; plain
+        callables run in the event loop's default executor. At most
+        ``max_workers`` agent calls are in flight at once.
+
+        Args:
+            test_cases: Optional test cases to use (uses loaded dataset if not provided)
 
+        Returns:
+            EvaluationResult with complete evaluation data
+
+        Raises:
+            ValueError: If no test cases provided
+            ValueError: If no metrics registered
+        """
+        start_time = time.time()
+        cases_to_evaluate = self._resolve_test_cases(test_cases)
+
+        semaphore = asyncio.Semaphore(self.max_workers or self.DEFAULT_ASYNC_CONCURRENCY)
+
+        async def run(agent_input: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+            async with semaphore:
+                return await _call_agent_async(self.agent, agent_input)
+
+        agent_results = list(
+            await asyncio.gather(*(run(test_case.input) for test_case in cases_to_evaluate))
+        )
+
+        return self._build_result(cases_to_evaluate, agent_results, start_time)
+
+    def _resolve_test_cases(self, test_cases: Optional[List[TestCase]]) -> List[TestCase]:
+        """Pick the test cases to evaluate and check the evaluator is ready.
+
+        Raises:
+            ValueError: If no test cases provided
+            ValueError: If no metrics registered
+        """
         # Use provided test cases or fall back to loaded dataset
         cases_to_evaluate = test_cases or self.test_cases
         if not cases_to_evaluate:
@@ -118,12 +232,34 @@ class AgentEvaluator:
         if self.registry.count() == 0:
             raise ValueError("No metrics registered for evaluation")
 
+        return cases_to_evaluate
+
+    def _build_result(
+        self,
+        test_cases: List[TestCase],
+        agent_results: List[Tuple[Any, Optional[str]]],
+        start_time: float,
+        agent_id: Optional[str] = None,
+    ) -> EvaluationResult:
+        """Score the agent results on every layer and assemble the evaluation result.
+
+        Args:
+            test_cases: Test cases that were run
+            agent_results: (output, error) tuples from the agent, in test case order
+            start_time: time.time() at the start of the evaluation
+            agent_id: Identifier to report (defaults to the evaluator's agent_id)
+
+        Returns:
+            EvaluationResult with complete evaluation data
+        """
+        evaluation_id = f"eval_{uuid.uuid4().hex}"
+
         # Evaluate each layer
         layer_results: List[LayerResult] = []
         all_critical_issues: List[str] = []
 
         for layer_num in range(1, 6):
-            layer_result = self._evaluate_layer(layer_num, cases_to_evaluate)
+            layer_result = self._evaluate_layer(layer_num, test_cases, agent_results)
             layer_results.append(layer_result)
 
             # Collect critical issues
@@ -141,28 +277,32 @@ class AgentEvaluator:
 
         return EvaluationResult(
             evaluation_id=evaluation_id,
-            agent_id=self.agent_id,
+            agent_id=self.agent_id if agent_id is None else agent_id,
             overall_score=overall_score,
             layers=layer_results,
             critical_issues=all_critical_issues,
-            test_cases_count=len(cases_to_evaluate),
+            test_cases_count=len(test_cases),
             duration_seconds=duration,
             passed=passed,
         )
 
-    def _evaluate_layer(self, layer_num: int, test_cases: List[TestCase]) -> LayerResult:
+    def _evaluate_layer(
+        self,
+        layer_num: int,
+        test_cases: List[TestCase],
+        agent_results: List[Tuple[Any, Optional[str]]],
+    ) -> LayerResult:
         """Evaluate a single layer.
 
         Args:
             layer_num: Layer number to evaluate
             test_cases: Test cases to use
+            agent_results: (output, error) tuples from the agent, in test case order
 
         Returns:
             LayerResult for the layer
         """
-        metrics = self.registry.get_metrics_by_layer(layer_num)
-
-        if not metrics:
+        if self.registry.count_by_layer(layer_num) == 0:
             # No metrics for this layer, return perfect score
             return LayerResult(
                 layer_number=layer_num,
@@ -173,40 +313,24 @@ class AgentEvaluator:
             )
 
         metric_results: List[MetricResult] = []
+        metric_score_sum = 0.0
+        all_metrics_passed = True
 
         # Run each metric on all test cases
-        for metric in metrics:
-            test_results = []
-
-            for test_case in test_cases:
-                try:
-                    # Run agent on test case
-                    output = self.agent(test_case.input)
-
-                    # Evaluate metric
-                    result = metric.evaluate(
-                        output=output,
-                        ground_truth=test_case.ground_truth,
-                        test_case=test_case,
-                    )
-                    test_results.append(result)
-                except Exception as e:
-                    # Handle evaluation errors
-                    test_results.append(
-                        MetricResult(
-                            metric_name=metric.name,
-                            layer=metric.layer,
-                            score=0.0,
-                            threshold=metric.threshold,
-                            passed=False,
-                            severity=Severity.CRITICAL,
-                            details={"error": str(e)},
-                            remediation=f"Fix error in {metric.name} evaluation: {str(e)}",
-                        )
-                    )
+        for metric in self.registry.iter_metrics_by_layer(layer_num):
+            # Accumulate the aggregates while the per-case results are produced
+            scores: List[float] = []
+            score_sum = 0.0
+            correct = 0
+            for test_case, (output, error) in zip(test_cases, agent_results):
+                result = self._evaluate_test_case(metric, test_case, output, error)
+                scores.append(result.score)
+                score_sum += result.score
+                if result.passed:
+                    correct += 1
 
             # Aggregate results for this metric (average score across test cases)
-            avg_score = sum(r.score for r in test_results) / len(test_results)
+            avg_score = score_sum / len(scores)
             passed = avg_score >= metric.threshold
 
             aggregated_result = MetricResult(
@@ -217,18 +341,20 @@ class AgentEvaluator:
                 passed=passed,
                 severity=metric.severity,
                 details={
-                    "correct": sum(1 for r in test_results if r.passed),
-                    "total": len(test_results),
-                    "individual_scores": [r.score for r in test_results],
+                    "correct": correct,
+                    "total": len(scores),
+                    "individual_scores": scores,
                 },
                 remediation=None if passed else f"{metric.name} below threshold. Review agent implementation.",
             )
 
             metric_results.append(aggregated_result)
+            metric_score_sum += aggregated_result.score
+            all_metrics_passed = all_metrics_passed and passed
 
         # Calculate layer score (average of metric scores)
-        layer_score = sum(m.score for m in metric_results) / len(metric_results)
-        layer_status = "pass" if all(m.passed for m in metric_results) else "fail"
+        layer_score = metric_score_sum / len(metric_results)
+        layer_status = "pass" if all_metrics_passed else "fail"
 
         return LayerResult(
             layer_number=layer_num,
@@ -238,40 +364,133 @@ class AgentEvaluator:
             metrics=metric_results,
         )
 
+    def _create_executor(self) -> Executor:
+        """Create the executor used for parallel evaluation."""
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _run_agent(
+        self,
+        test_cases: List[TestCase],
+        executor: Optional[Executor] = None,
+        agent: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> List[Tuple[Any, Optional[str]]]:
+        """Run the agent on every test case.
+
+        Args:
+            test_cases: Test cases to run
+            executor: Optional executor used to run the agent concurrently
+            agent: Agent to run (defaults to the evaluator's agent)
+
+        Returns:
+            List of (output, error) tuples, in test case order
+        """
+        if agent is None:
+            agent = self.agent
+        inputs = [test_case.input for test_case in test_cases]
+
+        if executor is None:
+            return [_call_agent(agent, agent_input) for agent_input in inputs]
+
+        # Batch tasks so process pools are not dominated by per-task overhead
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(inputs) // (workers * 4))
+        return list(executor.map(_call_agent, repeat(agent), inputs, chunksize=chunksize))
+
+    def _evaluate_test_case(
+        self,
+        metric: BaseMetric,
+        test_case: TestCase,
+        output: Any,
+        error: Optional[str] = None,
+    ) -> MetricResult:
+        """Evaluate one metric on the agent output for a single test case.
+
+        Args:
+            metric: Metric to evaluate
+            test_case: Test case the output was produced for
+            output: Agent output
+            error: Error message if the agent failed on this test case
+
+        Returns:
+            MetricResult for the test case
+        """
+        context = f"{metric.name} evaluation"
+        if error is not None:
+            # The agent failed, so there is no output to evaluate
+            return metric._error_result(error, context)
+
+        try:
+            return metric.evaluate(
+                output=output,
+                ground_truth=test_case.ground_truth,
+                test_case=test_case,
+            )
+        except Exception as e:
+            return metric._error_result(e, context)
+
     def compare(
         self,
         agents: List[Callable[[Dict[str, Any]], Any]],
         test_dataset: Optional[Union[str, Path, List[Dict[str, Any]]]] = None,
+        parallel: bool = False,
     ) -> List[EvaluationResult]:
         """Compare multiple agents on the same test dataset.
 
+        Test cases are loaded once and shared by every agent. The evaluator's
+        own agent and agent_id are left untouched.
+
         Args:
             agents: List of agent functions to compare
             test_dataset: Test dataset to use (uses loaded dataset if not provided)
+            parallel: Whether to evaluate the agents concurrently in a thread pool
 
         Returns:
             List of EvaluationResults, one per agent
         """
-        results = []
-        original_agent = self.agent
-
         test_cases = None
         if test_dataset:
             if isinstance(test_dataset, (str, Path)):
-                test_cases = TestLoader.load_from_json(test_dataset)
+                test_cases = TestLoader.load_from_file(test_dataset)
             else:
                 test_cases = TestLoader.load_from_list(test_dataset)
 
-        for i, agent in enumerate(agents):
-            self.agent = agent
-            self.agent_id = f"agent_{i+1}"
-            result = self.evaluate(test_cases=test_cases)
-            results.append(result)
+        cases_to_evaluate = self._resolve_test_cases(test_cases)
+        agent_ids = [f"agent_{i+1}" for i in range(len(agents))]
 
-        # Restore original agent
-        self.agent = original_agent
+        if parallel and len(agents) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers or len(agents)) as executor:
+                return list(
+                    executor.map(
+                        self._evaluate_agent, agents, agent_ids, repeat(cases_to_evaluate)
+                    )
+                )
 
-        return results
+        return [
+            self._evaluate_agent(agent, agent_id, cases_to_evaluate)
+            for agent, agent_id in zip(agents, agent_ids)
+        ]
+
+    def _evaluate_agent(
+        self,
+        agent: Callable[[Dict[str, Any]], Any],
+        agent_id: str,
+        test_cases: List[TestCase],
+    ) -> EvaluationResult:
+        """Evaluate one agent on the given test cases without mutating the evaluator.
+
+        Args:
+            agent: Agent function to evaluate
+            agent_id: Identifier to report for the agent
+            test_cases: Test cases to use
+
+        Returns:
+            EvaluationResult for the agent
+        """
+        start_time = time.time()
+        agent_results = self._run_agent(test_cases, agent=agent)
+        return self._build_result(test_cases, agent_results, start_time, agent_id=agent_id)
 
     def __repr__(self) -> str:
         return f"AgentEvaluator(agent_id={self.agent_id}, metrics={self.registry.count()}, tests={len(self.test_cases)})"
@@ -1,8 +1,9 @@
 """Base metric classes for MMAP evaluation."""
 
+import functools
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -43,12 +44,45 @@ class MetricResult(BaseModel):
         return f"{self.metric_name}: {status} (score: {self.score:.2f}, threshold: {self.threshold:.2f})"
 
 
+EvaluateFn = Callable[..., MetricResult]
+
+
+def safe_evaluate(context: str) -> Callable[[EvaluateFn], EvaluateFn]:
+    """Decorate a metric's evaluate() so exceptions become a CRITICAL result.
+
+    Keeps the error handling out of the metric's own evaluation logic.
+
+    Args:
+        context: What was being evaluated, used in the remediation message
+            (e.g. "intent evaluation")
+
+    Returns:
+        Decorator for BaseMetric.evaluate implementations
+    """
+
+    def decorator(evaluate: EvaluateFn) -> EvaluateFn:
+        @functools.wraps(evaluate)
+        def wrapper(
+            self: "BaseMetric", output: Any, ground_truth: Any, **kwargs: Any
+        ) -> MetricResult:
+            try:
+                return evaluate(self, output, ground_truth, **kwargs)
+            except Exception as e:
+                return self._error_result(e, context)
+
+        return wrapper
+
+    return decorator
+
+
 class BaseMetric(ABC):
     """Base class for all metrics.
 
     All metrics must inherit from this class and implement the evaluate method.
     """
 
+    __slots__ = ("name", "layer", "threshold", "severity", "description")
+
     def __init__(
         self,
         name: str,
@@ -91,5 +125,54 @@ class BaseMetric(ABC):
         """
         pass
 
+    def _result(
+        self, score: float, details: Dict[str, Any], remediation: Optional[str] = None
+    ) -> MetricResult:
+        """Build the result of a completed evaluation.
+
+        Args:
+            score: Numeric score (0-1)
+            details: Additional details about the evaluation
+            remediation: Suggested remediation, reported only if the metric failed
+
+        Returns:
+            MetricResult with passed set by comparing score to the threshold
+        """
+        passed = score >= self.threshold
+        return MetricResult(
+            metric_name=self.name,
+            layer=self.layer,
+            score=score,
+            threshold=self.threshold,
+            passed=passed,
+            severity=self.severity,
+            details=details,
+            remediation=None if passed else remediation,
+        )
+
+    def _error_result(self, error: Union[Exception, str], context: str) -> MetricResult:
+        """Build the result for an evaluation that failed with an error.
+
+        Args:
+            error: Exception raised during evaluation, or an error message
+                (e.g. one captured from a failed agent call)
+            context: What was being evaluated (e.g. "intent evaluation")
+
+        Returns:
+            Failed MetricResult with CRITICAL severity
+        """
+        # Format the exception once; f"{error}" would call str() on it again
+        message = str(error)
+        return MetricResult(
+            metric_name=self.name,
+            layer=self.layer,
+            score=0.0,
+            threshold=self.threshold,
+            passed=False,
+            severity=Severity.CRITICAL,
+            details={"error": message},
+            remediation=f"Fix error in {context}: {message}",
+        )
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name}, layer={self.layer}, threshold={self.threshold})"
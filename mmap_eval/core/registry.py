@@ -1,6 +1,6 @@
 """Metric registry for managing and organizing metrics."""
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from mmap_eval.core.metric import BaseMetric
 
@@ -60,6 +60,21 @@ class MetricRegistry:
             raise ValueError(f"Invalid layer: {layer}")
         return self._metrics[layer].copy()
 
+    def iter_metrics_by_layer(self, layer: int) -> Iterator[BaseMetric]:
+        """Iterate over the metrics for a specific layer without copying.
+
+        The registry must not be modified while iterating.
+
+        Args:
+            layer: Layer number (1-5)
+
+        Returns:
+            Iterator over the metrics for the layer
+        """
+        if layer not in self._metrics:
+            raise ValueError(f"Invalid layer: {layer}")
+        return iter(self._metrics[layer])
+
     def get_metric(self, name: str) -> Optional[BaseMetric]:
         """Get a metric by name.
 
@@ -1,7 +1,7 @@
 """Result aggregation and reporting."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -10,6 +10,11 @@ from pydantic import BaseModel, Field
 from mmap_eval.core.metric import MetricResult, Severity
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a ``Z`` suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 class LayerResult(BaseModel):
     """Results for a single evaluation layer.
 
@@ -59,7 +64,7 @@ class EvaluationResult(BaseModel):
     """
 
     evaluation_id: str
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    timestamp: str = Field(default_factory=_utc_timestamp)
     agent_id: Optional[str] = None
     overall_score: float = Field(ge=0, le=1)
     layers: List[LayerResult]
@@ -83,7 +88,7 @@ class EvaluationResult(BaseModel):
         if file_path:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w") as f:
+            with open(path, "w", encoding="utf-8") as f:
                 f.write(json_str)
 
         return json_str
@@ -99,7 +104,7 @@ class EvaluationResult(BaseModel):
             EvaluationResult object
         """
         if Path(json_str).exists():
-            with open(json_str, "r") as f:
+            with open(json_str, "r", encoding="utf-8") as f:
                 json_str = f.read()
 
         return cls.model_validate_json(json_str)
@@ -2,9 +2,9 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TestCase(BaseModel):
@@ -30,6 +30,10 @@ class TestCase(BaseModel):
         return cls(**data)
 
 
+# Validates and serializes whole lists of test cases in a single pydantic-core call
+_TEST_CASES_ADAPTER = TypeAdapter(List[TestCase])
+
+
 class TestLoader:
     """Loads test cases from various sources."""
 
@@ -51,17 +55,73 @@ class TestLoader:
         if not path.exists():
             raise FileNotFoundError(f"Test file not found: {file_path}")
 
-        with open(path, "r") as f:
+        with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
         # Handle both single test case and list of test cases
         if isinstance(data, dict):
             return [TestCase.from_dict(data)]
         elif isinstance(data, list):
-            return [TestCase.from_dict(item) for item in data]
+            return _TEST_CASES_ADAPTER.validate_python(data)
         else:
             raise ValueError(f"Invalid test data format: expected dict or list, got {type(data)}")
 
+    @staticmethod
+    def iter_from_jsonl(file_path: Union[str, Path]) -> Iterator[TestCase]:
+        """Stream test cases from a JSON Lines file (one test case per line).
+
+        Only one line is held in memory at a time, so large datasets can be
+        loaded without materializing the whole document first.
+
+        Args:
+            file_path: Path to JSON Lines file containing test cases
+
+        Yields:
+            TestCase objects, in file order
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If a line is not valid JSON
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Test file not found: {file_path}")
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                # Skip blank lines (e.g. a trailing newline)
+                if line.strip():
+                    yield TestCase.from_dict(json.loads(line))
+
+    @staticmethod
+    def load_from_jsonl(file_path: Union[str, Path]) -> List[TestCase]:
+        """Load test cases from a JSON Lines file (one test case per line).
+
+        Args:
+            file_path: Path to JSON Lines file containing test cases
+
+        Returns:
+            List of TestCase objects
+        """
+        return list(TestLoader.iter_from_jsonl(file_path))
+
+    @staticmethod
+    def load_from_file(file_path: Union[str, Path]) -> List[TestCase]:
+        """Load test cases from a JSON or JSON Lines file.
+
+        Files with a ``.jsonl`` extension (in any case) are streamed line by
+        line; anything else is parsed as a JSON document.
+
+        Args:
+            file_path: Path to test case file
+
+        Returns:
+            List of TestCase objects
+        """
+        if Path(file_path).suffix.lower() == ".jsonl":
+            return TestLoader.load_from_jsonl(file_path)
+        return TestLoader.load_from_json(file_path)
+
     @staticmethod
     def load_from_list(test_cases: List[Dict[str, Any]]) -> List[TestCase]:
         """Load test cases from a list of dictionaries.
@@ -72,11 +132,11 @@ class TestLoader:
         Returns:
             List of TestCase objects
         """
-        return [TestCase.from_dict(tc) for tc in test_cases]
+        return _TEST_CASES_ADAPTER.validate_python(test_cases)
 
     @staticmethod
     def save_to_json(test_cases: List[TestCase], file_path: Union[str, Path]) -> None:
-        """Save test cases to a JSON file.
+        """Save test cases to a UTF-8 encoded JSON file.
 
         Args:
             test_cases: List of TestCase objects
@@ -85,9 +145,5 @@ class TestLoader:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w") as f:
-            json.dump(
-                [tc.model_dump() for tc in test_cases],
-                f,
-                indent=2
-            )
+        with open(path, "wb") as f:
+            f.write(_TEST_CASES_ADAPTER.dump_json(test_cases, indent=2))
@@ -1,15 +1,24 @@
-"""Pre-built metrics for MMAP evaluation."""
+"""Pre-built metrics for MMAP evaluation.
 
-from mmap_eval.metrics.layer1.entity_extraction import EntityExtractionAccuracy
-from mmap_eval.metrics.layer1.intent_accuracy import IntentAccuracy
-from mmap_eval.metrics.layer2.decision_accuracy import DecisionAccuracy
-from mmap_eval.metrics.layer2.hallucination_detection import HallucinationDetection
-from mmap_eval.metrics.layer3.api_latency import APILatency
-from mmap_eval.metrics.layer3.transaction_success import TransactionSuccess
-from mmap_eval.metrics.layer4.edge_case_handling import EdgeCaseHandling
-from mmap_eval.metrics.layer4.policy_compliance import PolicyCompliance
-from mmap_eval.metrics.layer5.audit_trail import AuditTrail
-from mmap_eval.metrics.layer5.demographic_parity import DemographicParity
+Metric modules are imported on first access, so using a few metrics doesn't
+load all of them.
+"""
+
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.metrics.layer1.entity_extraction import EntityExtractionAccuracy
+    from mmap_eval.metrics.layer1.intent_accuracy import IntentAccuracy
+    from mmap_eval.metrics.layer2.decision_accuracy import DecisionAccuracy
+    from mmap_eval.metrics.layer2.hallucination_detection import HallucinationDetection
+    from mmap_eval.metrics.layer3.api_latency import APILatency
+    from mmap_eval.metrics.layer3.transaction_success import TransactionSuccess
+    from mmap_eval.metrics.layer4.edge_case_handling import EdgeCaseHandling
+    from mmap_eval.metrics.layer4.policy_compliance import PolicyCompliance
+    from mmap_eval.metrics.layer5.audit_trail import AuditTrail
+    from mmap_eval.metrics.layer5.demographic_parity import DemographicParity
 
 __all__ = [
     # Layer 1: Input/Output Validation
@@ -28,3 +37,19 @@ __all__ = [
     "DemographicParity",
     "AuditTrail",
 ]
+
+# Metric class name -> defining module, imported on first access (PEP 562)
+_METRIC_MODULES = {
+    "EntityExtractionAccuracy": "mmap_eval.metrics.layer1.entity_extraction",
+    "IntentAccuracy": "mmap_eval.metrics.layer1.intent_accuracy",
+    "DecisionAccuracy": "mmap_eval.metrics.layer2.decision_accuracy",
+    "HallucinationDetection": "mmap_eval.metrics.layer2.hallucination_detection",
+    "APILatency": "mmap_eval.metrics.layer3.api_latency",
+    "TransactionSuccess": "mmap_eval.metrics.layer3.transaction_success",
+    "EdgeCaseHandling": "mmap_eval.metrics.layer4.edge_case_handling",
+    "PolicyCompliance": "mmap_eval.metrics.layer4.policy_compliance",
+    "AuditTrail": "mmap_eval.metrics.layer5.audit_trail",
+    "DemographicParity": "mmap_eval.metrics.layer5.demographic_parity",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _METRIC_MODULES)
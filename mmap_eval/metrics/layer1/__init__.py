@@ -1,6 +1,19 @@
 """Layer 1: Input/Output Validation metrics."""
 
-from mmap_eval.metrics.layer1.entity_extraction import EntityExtractionAccuracy
-from mmap_eval.metrics.layer1.intent_accuracy import IntentAccuracy
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.metrics.layer1.entity_extraction import EntityExtractionAccuracy
+    from mmap_eval.metrics.layer1.intent_accuracy import IntentAccuracy
 
 __all__ = ["IntentAccuracy", "EntityExtractionAccuracy"]
+
+# Metric class name -> defining module, imported on first access (PEP 562)
+_METRIC_MODULES = {
+    "EntityExtractionAccuracy": "mmap_eval.metrics.layer1.entity_extraction",
+    "IntentAccuracy": "mmap_eval.metrics.layer1.intent_accuracy",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _METRIC_MODULES)
@@ -1,8 +1,8 @@
 """Entity extraction accuracy metric for Layer 1."""
 
-from typing import Any, Dict, Set
+from typing import Any, Dict
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class EntityExtractionAccuracy(BaseMetric):
@@ -19,6 +19,8 @@ class EntityExtractionAccuracy(BaseMetric):
         ... )
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         threshold: float = 0.85,
@@ -38,6 +40,7 @@ class EntityExtractionAccuracy(BaseMetric):
             description="Measures accuracy of entity extraction",
         )
 
+    @safe_evaluate("entity extraction evaluation")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate entity extraction accuracy.
 
@@ -49,59 +52,33 @@ class EntityExtractionAccuracy(BaseMetric):
         Returns:
             MetricResult with F1 score
         """
-        try:
-            # Extract entities
-            predicted_entities = self._extract_entities(output)
-            true_entities = self._extract_entities(ground_truth)
-
-            if predicted_entities is None or true_entities is None:
-                score = 0.0
-                details = {"error": "Missing entities field"}
-            else:
-                # Calculate F1 score
-                score, precision, recall = self._calculate_f1(
-                    predicted_entities, true_entities
-                )
-                details = {
-                    "predicted": predicted_entities,
-                    "expected": true_entities,
-                    "precision": precision,
-                    "recall": recall,
-                    "f1_score": score,
-                }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else "Review entity extraction logic and improve NER model",
-            )
+        # Extract entities
+        predicted_entities = self._extract_entities(output)
+        true_entities = self._extract_entities(ground_truth)
 
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in entity extraction evaluation: {str(e)}",
+        if predicted_entities is None or true_entities is None:
+            score = 0.0
+            details = {"error": "Missing entities field"}
+        else:
+            # Calculate F1 score
+            score, precision, recall = self._calculate_f1(
+                predicted_entities, true_entities
             )
+            details = {
+                "predicted": predicted_entities,
+                "expected": true_entities,
+                "precision": precision,
+                "recall": recall,
+                "f1_score": score,
+            }
+
+        return self._result(score, details, "Review entity extraction logic and improve NER model")
 
     def _extract_entities(self, data: Any) -> Any:
         """Extract entities from data."""
         if isinstance(data, dict):
             return data.get("entities", {})
-        elif hasattr(data, "entities"):
-            return data.entities
-        return None
+        return getattr(data, "entities", None)
 
     def _calculate_f1(
         self, predicted: Dict[str, Any], true: Dict[str, Any]
@@ -118,17 +95,20 @@ class EntityExtractionAccuracy(BaseMetric):
         if not true:
             return 1.0 if not predicted else 0.0, 1.0, 1.0
 
-        # Convert to sets of (key, value) pairs for comparison
-        pred_items = set(predicted.items())
-        true_items = set(true.items())
+        # Nothing predicted: no true positives, so precision and recall are 0
+        if not predicted:
+            return 0.0, 0.0, 0.0
 
-        # Calculate precision and recall
-        true_positives = len(pred_items & true_items)
-        false_positives = len(pred_items - true_items)
-        false_negatives = len(true_items - pred_items)
+        # Entity names are unique dict keys, so a predicted (key, value) pair
+        # matches when the key is expected with an equal value. Looking up
+        # keys avoids hashing every pair and also works for unhashable values.
+        true_positives = sum(
+            1 for key, value in predicted.items() if key in true and true[key] == value
+        )
 
-        precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
-        recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0.0
+        # Calculate precision and recall (both dicts are non-empty here)
+        precision = true_positives / len(predicted)
+        recall = true_positives / len(true)
 
         # Calculate F1
         if precision + recall == 0:
@@ -1,8 +1,8 @@
 """Intent accuracy metric for Layer 1."""
 
-from typing import Any, Dict
+from typing import Any
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class IntentAccuracy(BaseMetric):
@@ -21,6 +21,8 @@ class IntentAccuracy(BaseMetric):
         1.0
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         threshold: float = 0.9,
@@ -40,6 +42,7 @@ class IntentAccuracy(BaseMetric):
             description="Measures accuracy of intent classification",
         )
 
+    @safe_evaluate("intent evaluation")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate intent accuracy.
 
@@ -51,51 +54,27 @@ class IntentAccuracy(BaseMetric):
         Returns:
             MetricResult with accuracy score
         """
-        try:
-            # Extract intents
-            predicted_intent = self._extract_intent(output)
-            true_intent = self._extract_intent(ground_truth)
-
-            # Compare intents
-            if predicted_intent is None or true_intent is None:
-                score = 0.0
-                details = {
-                    "error": "Missing intent field",
-                    "predicted": predicted_intent,
-                    "expected": true_intent,
-                }
-            else:
-                score = 1.0 if predicted_intent == true_intent else 0.0
-                details = {
-                    "predicted": predicted_intent,
-                    "expected": true_intent,
-                    "match": predicted_intent == true_intent,
-                }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else "Review intent classification logic and training data",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in intent evaluation: {str(e)}",
-            )
+        # Extract intents
+        predicted_intent = self._extract_intent(output)
+        true_intent = self._extract_intent(ground_truth)
+
+        # Compare intents
+        if predicted_intent is None or true_intent is None:
+            score = 0.0
+            details = {
+                "error": "Missing intent field",
+                "predicted": predicted_intent,
+                "expected": true_intent,
+            }
+        else:
+            score = 1.0 if predicted_intent == true_intent else 0.0
+            details = {
+                "predicted": predicted_intent,
+                "expected": true_intent,
+                "match": predicted_intent == true_intent,
+            }
+
+        return self._result(score, details, "Review intent classification logic and training data")
 
     def _extract_intent(self, data: Any) -> Any:
         """Extract intent from data.
@@ -108,6 +87,4 @@ class IntentAccuracy(BaseMetric):
         """
         if isinstance(data, dict):
             return data.get("intent")
-        elif hasattr(data, "intent"):
-            return data.intent
-        return None
+        return getattr(data, "intent", None)
@@ -1,6 +1,19 @@
 """Layer 2: Model Performance metrics."""
 
-from mmap_eval.metrics.layer2.decision_accuracy import DecisionAccuracy
-from mmap_eval.metrics.layer2.hallucination_detection import HallucinationDetection
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.metrics.layer2.decision_accuracy import DecisionAccuracy
+    from mmap_eval.metrics.layer2.hallucination_detection import HallucinationDetection
 
 __all__ = ["DecisionAccuracy", "HallucinationDetection"]
+
+# Metric class name -> defining module, imported on first access (PEP 562)
+_METRIC_MODULES = {
+    "DecisionAccuracy": "mmap_eval.metrics.layer2.decision_accuracy",
+    "HallucinationDetection": "mmap_eval.metrics.layer2.hallucination_detection",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _METRIC_MODULES)
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class DecisionAccuracy(BaseMetric):
@@ -12,6 +12,8 @@ class DecisionAccuracy(BaseMetric):
     and context (e.g., approve/deny, escalate, take action).
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         threshold: float = 0.95,
@@ -31,6 +33,7 @@ class DecisionAccuracy(BaseMetric):
             description="Measures accuracy of agent decisions",
         )
 
+    @safe_evaluate("decision evaluation")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate decision accuracy.
 
@@ -42,54 +45,28 @@ class DecisionAccuracy(BaseMetric):
         Returns:
             MetricResult with accuracy score
         """
-        try:
-            predicted_decision = self._extract_decision(output)
-            true_decision = self._extract_decision(ground_truth)
-
-            if predicted_decision is None or true_decision is None:
-                score = 0.0
-                details = {
-                    "error": "Missing decision field",
-                    "predicted": predicted_decision,
-                    "expected": true_decision,
-                }
-            else:
-                score = 1.0 if predicted_decision == true_decision else 0.0
-                details = {
-                    "predicted": predicted_decision,
-                    "expected": true_decision,
-                    "match": predicted_decision == true_decision,
-                }
-
-            passed = score >= self.threshold
+        predicted_decision = self._extract_decision(output)
+        true_decision = self._extract_decision(ground_truth)
 
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else "Review decision-making logic and model training",
-            )
+        if predicted_decision is None or true_decision is None:
+            score = 0.0
+            details = {
+                "error": "Missing decision field",
+                "predicted": predicted_decision,
+                "expected": true_decision,
+            }
+        else:
+            score = 1.0 if predicted_decision == true_decision else 0.0
+            details = {
+                "predicted": predicted_decision,
+                "expected": true_decision,
+                "match": predicted_decision == true_decision,
+            }
 
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in decision evaluation: {str(e)}",
-            )
+        return self._result(score, details, "Review decision-making logic and model training")
 
     def _extract_decision(self, data: Any) -> Any:
         """Extract decision from data."""
         if isinstance(data, dict):
             return data.get("decision")
-        elif hasattr(data, "decision"):
-            return data.decision
-        return None
+        return getattr(data, "decision", None)
@@ -1,8 +1,8 @@
 """Hallucination detection metric for Layer 2."""
 
-from typing import Any, Set
+from typing import Any
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class HallucinationDetection(BaseMetric):
@@ -12,6 +12,19 @@ class HallucinationDetection(BaseMetric):
     or makes claims not grounded in facts.
     """
 
+    __slots__ = ()
+
+    # Common hallucination indicators (lowercase, matched as substrings)
+    HALLUCINATION_KEYWORDS = (
+        "i don't have access",
+        "i cannot verify",
+        "according to my knowledge",
+        "as far as i know",
+        "i believe",
+        "probably",
+        "might be",
+    )
+
     def __init__(
         self,
         threshold: float = 0.9,
@@ -31,6 +44,7 @@ class HallucinationDetection(BaseMetric):
             description="Detects hallucinated or unsupported information",
         )
 
+    @safe_evaluate("hallucination detection")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate for hallucinations.
 
@@ -42,55 +56,31 @@ class HallucinationDetection(BaseMetric):
         Returns:
             MetricResult with hallucination score (1.0 = no hallucination)
         """
-        try:
-            # Check if ground truth indicates hallucination should not occur
-            hallucination_expected = self._extract_hallucination_flag(ground_truth)
-            response_text = self._extract_response(output)
-
-            if response_text is None:
-                score = 0.0
-                details = {"error": "No response text found"}
+        # Check if ground truth indicates hallucination should not occur
+        hallucination_expected = self._extract_hallucination_flag(ground_truth)
+        response_text = self._extract_response(output)
+
+        if response_text is None:
+            score = 0.0
+            details = {"error": "No response text found"}
+        else:
+            # Simple heuristic: check for common hallucination indicators
+            has_hallucination = self._detect_hallucination(response_text, ground_truth)
+
+            if hallucination_expected:
+                # Hallucination was expected, check if detected
+                score = 1.0 if has_hallucination else 0.0
             else:
-                # Simple heuristic: check for common hallucination indicators
-                has_hallucination = self._detect_hallucination(response_text, ground_truth)
-
-                if hallucination_expected:
-                    # Hallucination was expected, check if detected
-                    score = 1.0 if has_hallucination else 0.0
-                else:
-                    # No hallucination expected
-                    score = 0.0 if has_hallucination else 1.0
-
-                details = {
-                    "hallucination_detected": has_hallucination,
-                    "hallucination_expected": hallucination_expected,
-                    "response_length": len(response_text),
-                }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else "Improve grounding and fact-checking in responses",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in hallucination detection: {str(e)}",
-            )
+                # No hallucination expected
+                score = 0.0 if has_hallucination else 1.0
+
+            details = {
+                "hallucination_detected": has_hallucination,
+                "hallucination_expected": hallucination_expected,
+                "response_length": len(response_text),
+            }
+
+        return self._result(score, details, "Improve grounding and fact-checking in responses")
 
     def _extract_hallucination_flag(self, ground_truth: Any) -> bool:
         """Extract whether hallucination is expected."""
@@ -104,9 +94,7 @@ class HallucinationDetection(BaseMetric):
             return output
         elif isinstance(output, dict):
             return output.get("response", output.get("text", ""))
-        elif hasattr(output, "response"):
-            return output.response
-        return ""
+        return getattr(output, "response", "")
 
     def _detect_hallucination(self, response: str, ground_truth: Any) -> bool:
         """Detect potential hallucinations.
@@ -114,21 +102,10 @@ class HallucinationDetection(BaseMetric):
         This is a simple heuristic-based approach. In production, you'd want
         to use more sophisticated methods (LLM-as-judge, fact verification, etc.)
         """
-        # Check for common hallucination indicators
-        hallucination_keywords = [
-            "i don't have access",
-            "i cannot verify",
-            "according to my knowledge",
-            "as far as i know",
-            "i believe",
-            "probably",
-            "might be",
-        ]
-
         response_lower = response.lower()
 
         # Check if response contains hallucination indicators
-        for keyword in hallucination_keywords:
+        for keyword in self.HALLUCINATION_KEYWORDS:
             if keyword in response_lower:
                 return True
 
@@ -1,6 +1,19 @@
 """Layer 3: System Integration metrics."""
 
-from mmap_eval.metrics.layer3.api_latency import APILatency
-from mmap_eval.metrics.layer3.transaction_success import TransactionSuccess
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.metrics.layer3.api_latency import APILatency
+    from mmap_eval.metrics.layer3.transaction_success import TransactionSuccess
 
 __all__ = ["APILatency", "TransactionSuccess"]
+
+# Metric class name -> defining module, imported on first access (PEP 562)
+_METRIC_MODULES = {
+    "APILatency": "mmap_eval.metrics.layer3.api_latency",
+    "TransactionSuccess": "mmap_eval.metrics.layer3.transaction_success",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _METRIC_MODULES)
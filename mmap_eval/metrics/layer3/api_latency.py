@@ -1,9 +1,11 @@
 """API latency metric for Layer 3."""
 
-import time
-from typing import Any
+from typing import Any, Dict, Optional, cast
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
+
+# Sentinel for attributes that are absent (distinct from an attribute set to None)
+_MISSING = object()
 
 
 class APILatency(BaseMetric):
@@ -12,6 +14,8 @@ class APILatency(BaseMetric):
     Evaluates whether the agent responds within acceptable time limits.
     """
 
+    __slots__ = ("max_latency_ms",)
+
     def __init__(
         self,
         max_latency_ms: float = 2000.0,
@@ -35,6 +39,7 @@ class APILatency(BaseMetric):
             description=f"Measures API response time (max: {max_latency_ms}ms)",
         )
 
+    @safe_evaluate("latency measurement")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate API latency.
 
@@ -46,56 +51,34 @@ class APILatency(BaseMetric):
         Returns:
             MetricResult with latency score
         """
-        try:
-            # Try to extract latency from output
-            latency_ms = self._extract_latency(output, kwargs)
-
-            if latency_ms is None:
-                score = 0.0
-                details = {"error": "No latency information available"}
-            else:
-                # Score based on how far below max latency
-                score = 1.0 if latency_ms <= self.max_latency_ms else self.max_latency_ms / latency_ms
-                score = max(0.0, min(1.0, score))  # Clamp to [0, 1]
-
-                details = {
-                    "latency_ms": latency_ms,
-                    "max_latency_ms": self.max_latency_ms,
-                    "within_limit": latency_ms <= self.max_latency_ms,
-                }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else "Optimize agent processing time and reduce API calls",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in latency measurement: {str(e)}",
-            )
-
-    def _extract_latency(self, output: Any, kwargs: dict) -> float:
+        # Try to extract latency from output
+        latency_ms = self._extract_latency(output, kwargs)
+
+        if latency_ms is None:
+            score = 0.0
+            details: Dict[str, Any] = {"error": "No latency information available"}
+        else:
+            # Score based on how far below max latency
+            score = 1.0 if latency_ms <= self.max_latency_ms else self.max_latency_ms / latency_ms
+            score = max(0.0, min(1.0, score))  # Clamp to [0, 1]
+
+            details = {
+                "latency_ms": latency_ms,
+                "max_latency_ms": self.max_latency_ms,
+                "within_limit": latency_ms <= self.max_latency_ms,
+            }
+
+        return self._result(score, details, "Optimize agent processing time and reduce API calls")
+
+    def _extract_latency(self, output: Any, kwargs: dict) -> Optional[float]:
         """Extract latency from output or kwargs."""
         # Check if output contains latency
         if isinstance(output, dict) and "latency_ms" in output:
             return output["latency_ms"]
-        elif hasattr(output, "latency_ms"):
-            return output.latency_ms
+        latency_ms = getattr(output, "latency_ms", _MISSING)
+        if latency_ms is not _MISSING:
+            # Past the sentinel check this is the attribute's own value
+            return cast(Optional[float], latency_ms)
 
         # Check if kwargs contains timing information
         if "start_time" in kwargs and "end_time" in kwargs:
@@ -2,7 +2,10 @@
 
 from typing import Any
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
+
+# Status values that count as a successful transaction
+_SUCCESS_STATUSES = frozenset(("success", "completed", "ok"))
 
 
 class TransactionSuccess(BaseMetric):
@@ -12,6 +15,8 @@ class TransactionSuccess(BaseMetric):
     without errors.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         threshold: float = 0.99,
@@ -31,6 +36,7 @@ class TransactionSuccess(BaseMetric):
             description="Measures API/transaction success rate",
         )
 
+    @safe_evaluate("transaction evaluation")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate transaction success.
 
@@ -42,43 +48,21 @@ class TransactionSuccess(BaseMetric):
         Returns:
             MetricResult with success score
         """
-        try:
-            # Check for success indicators
-            success = self._check_success(output)
-            error = self._extract_error(output)
-
-            score = 1.0 if success and error is None else 0.0
-
-            details = {
-                "success": success,
-                "error": error,
-                "status": "completed" if success else "failed",
-            }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else f"Fix transaction failures: {error}",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in transaction evaluation: {str(e)}",
-            )
+        # Check for success indicators
+        success = self._check_success(output)
+        error = self._extract_error(output)
+
+        score = 1.0 if success and error is None else 0.0
+
+        details = {
+            "success": success,
+            "error": error,
+            "status": "completed" if success else "failed",
+        }
+
+        # Only format the remediation when the transaction failed
+        remediation = None if score else f"Fix transaction failures: {error}"
+        return self._result(score, details, remediation)
 
     def _check_success(self, output: Any) -> bool:
         """Check if transaction was successful."""
@@ -88,21 +72,20 @@ class TransactionSuccess(BaseMetric):
                 return bool(output["success"])
             # Check for status field
             if "status" in output:
-                return output["status"] in ["success", "completed", "ok"]
+                status = output["status"]
+                # Only strings can match; this also keeps unhashable statuses
+                # (e.g. {"code": 500}) out of the frozenset lookup
+                return isinstance(status, str) and status in _SUCCESS_STATUSES
             # Check for error field
             if "error" in output:
                 return output["error"] is None
             # If none of above, assume success
             return True
-        elif hasattr(output, "success"):
-            return output.success
         # Default to True if no error indicators
-        return True
+        return getattr(output, "success", True)
 
     def _extract_error(self, output: Any) -> str:
         """Extract error message if present."""
         if isinstance(output, dict):
             return output.get("error")
-        elif hasattr(output, "error"):
-            return output.error
-        return None
+        return getattr(output, "error", None)
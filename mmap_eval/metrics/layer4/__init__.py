@@ -1,6 +1,19 @@
 """Layer 4: Business Logic metrics."""
 
-from mmap_eval.metrics.layer4.edge_case_handling import EdgeCaseHandling
-from mmap_eval.metrics.layer4.policy_compliance import PolicyCompliance
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.metrics.layer4.edge_case_handling import EdgeCaseHandling
+    from mmap_eval.metrics.layer4.policy_compliance import PolicyCompliance
 
 __all__ = ["PolicyCompliance", "EdgeCaseHandling"]
+
+# Metric class name -> defining module, imported on first access (PEP 562)
+_METRIC_MODULES = {
+    "EdgeCaseHandling": "mmap_eval.metrics.layer4.edge_case_handling",
+    "PolicyCompliance": "mmap_eval.metrics.layer4.policy_compliance",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _METRIC_MODULES)
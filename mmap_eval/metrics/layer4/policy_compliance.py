@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class PolicyCompliance(BaseMetric):
@@ -12,6 +12,8 @@ class PolicyCompliance(BaseMetric):
     (e.g., refund limits, approval rules, escalation criteria).
     """
 
+    __slots__ = ("policies",)
+
     def __init__(
         self,
         policies: Dict[str, Any] = None,
@@ -35,6 +37,7 @@ class PolicyCompliance(BaseMetric):
             description="Measures compliance with business policies",
         )
 
+    @safe_evaluate("policy compliance check")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate policy compliance.
 
@@ -46,48 +49,26 @@ class PolicyCompliance(BaseMetric):
         Returns:
             MetricResult with compliance score
         """
-        try:
-            # Extract policy compliance indicators
-            policy_violations = self._check_policy_violations(output, ground_truth)
-
-            if policy_violations:
-                score = 0.0
-                details = {
-                    "violations": policy_violations,
-                    "total_policies_checked": len(policy_violations),
-                    "compliant": False,
-                }
-            else:
-                score = 1.0
-                details = {
-                    "violations": [],
-                    "compliant": True,
-                }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else f"Fix policy violations: {', '.join(policy_violations)}",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in policy compliance check: {str(e)}",
-            )
+        # Extract policy compliance indicators
+        policy_violations = self._check_policy_violations(output, ground_truth)
+
+        if policy_violations:
+            score = 0.0
+            details = {
+                "violations": policy_violations,
+                "total_policies_checked": len(policy_violations),
+                "compliant": False,
+            }
+            remediation = f"Fix policy violations: {', '.join(policy_violations)}"
+        else:
+            score = 1.0
+            details = {
+                "violations": [],
+                "compliant": True,
+            }
+            remediation = None
+
+        return self._result(score, details, remediation)
 
     def _check_policy_violations(self, output: Any, ground_truth: Any) -> List[str]:
         """Check for policy violations.
@@ -131,6 +112,4 @@ class PolicyCompliance(BaseMetric):
         """Extract a field from data."""
         if isinstance(data, dict):
             return data.get(field)
-        elif hasattr(data, field):
-            return getattr(data, field)
-        return None
+        return getattr(data, field, None)
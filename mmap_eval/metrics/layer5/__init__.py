@@ -1,6 +1,19 @@
 """Layer 5: Fairness & Compliance metrics."""
 
-from mmap_eval.metrics.layer5.audit_trail import AuditTrail
-from mmap_eval.metrics.layer5.demographic_parity import DemographicParity
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.metrics.layer5.audit_trail import AuditTrail
+    from mmap_eval.metrics.layer5.demographic_parity import DemographicParity
 
 __all__ = ["DemographicParity", "AuditTrail"]
+
+# Metric class name -> defining module, imported on first access (PEP 562)
+_METRIC_MODULES = {
+    "AuditTrail": "mmap_eval.metrics.layer5.audit_trail",
+    "DemographicParity": "mmap_eval.metrics.layer5.demographic_parity",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _METRIC_MODULES)
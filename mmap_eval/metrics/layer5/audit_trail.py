@@ -1,8 +1,8 @@
 """Audit trail metric for Layer 5."""
 
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class AuditTrail(BaseMetric):
@@ -12,6 +12,8 @@ class AuditTrail(BaseMetric):
     and debugging purposes.
     """
 
+    __slots__ = ("required_fields",)
+
     def __init__(
         self,
         required_fields: List[str] = None,
@@ -40,6 +42,7 @@ class AuditTrail(BaseMetric):
             description="Measures completeness of audit trails",
         )
 
+    @safe_evaluate("audit trail check")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate audit trail completeness.
 
@@ -51,55 +54,32 @@ class AuditTrail(BaseMetric):
         Returns:
             MetricResult with audit trail score
         """
-        try:
-            # Check for audit trail in output
-            audit_trail = self._extract_audit_trail(output)
-
-            if audit_trail is None:
-                score = 0.0
-                details = {
-                    "error": "No audit trail found",
-                    "required_fields": self.required_fields,
-                    "present_fields": [],
-                }
-            else:
-                # Check for required fields
-                present_fields = self._check_required_fields(audit_trail)
-                score = len(present_fields) / len(self.required_fields)
-
-                details = {
-                    "required_fields": self.required_fields,
-                    "present_fields": present_fields,
-                    "missing_fields": [
-                        f for f in self.required_fields if f not in present_fields
-                    ],
-                    "completeness": score,
-                }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else f"Add missing audit fields: {details.get('missing_fields', [])}",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in audit trail check: {str(e)}",
-            )
+        # Check for audit trail in output
+        audit_trail = self._extract_audit_trail(output)
+
+        if audit_trail is None:
+            score = 0.0
+            details = {
+                "error": "No audit trail found",
+                "required_fields": self.required_fields,
+                "present_fields": [],
+            }
+            # Every required field is missing when there is no trail at all
+            remediation: Optional[str] = f"Add missing audit fields: {self.required_fields}"
+        else:
+            # Check for required fields
+            present_fields, missing_fields = self._check_required_fields(audit_trail)
+            score = len(present_fields) / len(self.required_fields)
+
+            details = {
+                "required_fields": self.required_fields,
+                "present_fields": present_fields,
+                "missing_fields": missing_fields,
+                "completeness": score,
+            }
+            remediation = f"Add missing audit fields: {missing_fields}" if missing_fields else None
+
+        return self._result(score, details, remediation)
 
     def _extract_audit_trail(self, output: Any) -> Any:
         """Extract audit trail from output."""
@@ -111,33 +91,32 @@ class AuditTrail(BaseMetric):
                 return output["audit"]
             # Otherwise, use the output itself as audit trail
             return output
-        elif hasattr(output, "audit_trail"):
-            return output.audit_trail
-
-        return output
+        return getattr(output, "audit_trail", output)
 
-    def _check_required_fields(self, audit_trail: Any) -> List[str]:
+    def _check_required_fields(self, audit_trail: Any) -> Tuple[List[str], List[str]]:
         """Check which required fields are present.
 
         Args:
             audit_trail: Audit trail data
 
         Returns:
-            List of present required fields
+            Tuple of (present fields, missing fields), both in required order
         """
         present_fields = []
+        missing_fields = []
 
+        # Single pass; avoids a second scan of present_fields to find the gaps
         for field in self.required_fields:
             if self._has_field(audit_trail, field):
                 present_fields.append(field)
+            else:
+                missing_fields.append(field)
 
-        return present_fields
+        return present_fields, missing_fields
 
     def _has_field(self, data: Any, field: str) -> bool:
         """Check if field exists in data."""
         if isinstance(data, dict):
-            return field in data and data[field] is not None
-        elif hasattr(data, field):
-            return getattr(data, field) is not None
-
-        return False
+            # A missing key and an explicit None both count as absent
+            return data.get(field) is not None
+        return getattr(data, field, None) is not None
@@ -1,8 +1,8 @@
 """Demographic parity metric for Layer 5."""
 
-from typing import Any, Dict, List
+from typing import Any, List
 
-from mmap_eval.core.metric import BaseMetric, MetricResult, Severity
+from mmap_eval.core.metric import BaseMetric, MetricResult, Severity, safe_evaluate
 
 
 class DemographicParity(BaseMetric):
@@ -12,6 +12,8 @@ class DemographicParity(BaseMetric):
     demographic groups.
     """
 
+    __slots__ = ("protected_attributes",)
+
     def __init__(
         self,
         threshold: float = 0.95,
@@ -35,6 +37,7 @@ class DemographicParity(BaseMetric):
             description="Measures fairness across demographic groups",
         )
 
+    @safe_evaluate("demographic parity check")
     def evaluate(self, output: Any, ground_truth: Any, **kwargs: Any) -> MetricResult:
         """Evaluate demographic parity.
 
@@ -46,42 +49,18 @@ class DemographicParity(BaseMetric):
         Returns:
             MetricResult with parity score
         """
-        try:
-            # For single test case, we can only check for bias indicators
-            # Full demographic parity requires aggregate statistics
-            bias_detected = self._check_bias_indicators(output, ground_truth)
-
-            score = 0.0 if bias_detected else 1.0
-
-            details = {
-                "bias_detected": bias_detected,
-                "protected_attributes_checked": self.protected_attributes,
-            }
-
-            passed = score >= self.threshold
-
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=score,
-                threshold=self.threshold,
-                passed=passed,
-                severity=self.severity,
-                details=details,
-                remediation=None if passed else "Review decision logic for demographic bias",
-            )
-
-        except Exception as e:
-            return MetricResult(
-                metric_name=self.name,
-                layer=self.layer,
-                score=0.0,
-                threshold=self.threshold,
-                passed=False,
-                severity=Severity.CRITICAL,
-                details={"error": str(e)},
-                remediation=f"Fix error in demographic parity check: {str(e)}",
-            )
+        # For single test case, we can only check for bias indicators
+        # Full demographic parity requires aggregate statistics
+        bias_detected = self._check_bias_indicators(output, ground_truth)
+
+        score = 0.0 if bias_detected else 1.0
+
+        details = {
+            "bias_detected": bias_detected,
+            "protected_attributes_checked": self.protected_attributes,
+        }
+
+        return self._result(score, details, "Review decision logic for demographic bias")
 
     def _check_bias_indicators(self, output: Any, ground_truth: Any) -> bool:
         """Check for bias indicators.
@@ -1,6 +1,20 @@
 """Reporters for MMAP evaluation results."""
 
-from mmap_eval.reporters.json_reporter import JSONReporter
-from mmap_eval.reporters.terminal_reporter import TerminalReporter
+from typing import TYPE_CHECKING
+
+from mmap_eval._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mmap_eval.reporters.json_reporter import JSONReporter
+    from mmap_eval.reporters.terminal_reporter import TerminalReporter
 
 __all__ = ["TerminalReporter", "JSONReporter"]
+
+# Reporter class name -> defining module, imported on first access (PEP 562)
+# so JSON-only callers never pay for the rich import chain
+_REPORTER_MODULES = {
+    "JSONReporter": "mmap_eval.reporters.json_reporter",
+    "TerminalReporter": "mmap_eval.reporters.terminal_reporter",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _REPORTER_MODULES)
@@ -1,6 +1,6 @@
 """Terminal reporter for evaluation results."""
 
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -13,6 +13,33 @@ from mmap_eval.core.result import EvaluationResult
 class TerminalReporter:
     """Formats and prints evaluation results to terminal with colors."""
 
+    # Color used for each metric severity
+    SEVERITY_COLORS = {
+        "critical": "red",
+        "warning": "yellow",
+        "info": "blue",
+    }
+
+    # Status cell markup for passed/failed rows
+    PASS_MARK = "[green]✓[/green]"
+    FAIL_MARK = "[red]✗[/red]"
+
+    # (header, column options) for the layer summary and per-layer metric tables
+    LAYER_COLUMNS = (
+        ("Layer", {"style": "cyan", "width": 6}),
+        ("Name", {"style": "white", "width": 30}),
+        ("Score", {"justify": "right", "width": 10}),
+        ("Status", {"justify": "center", "width": 10}),
+        ("Metrics", {"justify": "right", "width": 10}),
+    )
+    METRIC_COLUMNS = (
+        ("Metric", {"style": "white", "width": 30}),
+        ("Score", {"justify": "right", "width": 10}),
+        ("Threshold", {"justify": "right", "width": 10}),
+        ("Status", {"justify": "center", "width": 10}),
+        ("Severity", {"justify": "center", "width": 10}),
+    )
+
     def __init__(self, console: Optional[Console] = None):
         """Initialize terminal reporter.
 
@@ -27,83 +54,77 @@ class TerminalReporter:
         Args:
             result: Evaluation result to print
         """
+        # Bound once; print is called for every line of the report
+        cprint = self.console.print
+        severity_colors = self.SEVERITY_COLORS
+
         # Header
         title = "MMAP Evaluation Report"
         if result.agent_id:
             title += f" - {result.agent_id}"
 
-        self.console.print()
-        self.console.print(Panel(title, style="bold blue"))
-        self.console.print()
+        cprint()
+        cprint(Panel(title, style="bold blue"))
+        cprint()
 
         # Overall Status
         status_color = "green" if result.passed else "red"
         status_text = "✓ PASS" if result.passed else "✗ FAIL"
-        self.console.print(f"[{status_color}]Status: {status_text}[/{status_color}]")
-        self.console.print(f"Overall Score: [bold]{result.overall_score:.2%}[/bold]")
-        self.console.print(f"Test Cases: {result.test_cases_count}")
-        self.console.print(f"Duration: {result.duration_seconds:.2f}s")
-        self.console.print(f"Evaluation ID: {result.evaluation_id}")
-        self.console.print()
+        cprint(f"[{status_color}]Status: {status_text}[/{status_color}]")
+        cprint(f"Overall Score: [bold]{result.overall_score:.2%}[/bold]")
+        cprint(f"Test Cases: {result.test_cases_count}")
+        cprint(f"Duration: {result.duration_seconds:.2f}s")
+        cprint(f"Evaluation ID: {result.evaluation_id}")
+        cprint()
 
         # Layer Results Table
-        table = Table(title="Layer Results", show_header=True, header_style="bold magenta")
-        table.add_column("Layer", style="cyan", width=6)
-        table.add_column("Name", style="white", width=30)
-        table.add_column("Score", justify="right", width=10)
-        table.add_column("Status", justify="center", width=10)
-        table.add_column("Metrics", justify="right", width=10)
+        table = self._make_table(
+            self.LAYER_COLUMNS, title="Layer Results", header_style="bold magenta"
+        )
 
+        add_row = table.add_row
         for layer in result.layers:
-            status_icon = "✓" if layer.passed else "✗"
-            status_color = "green" if layer.passed else "red"
-            status_text = f"[{status_color}]{status_icon}[/{status_color}]"
-
-            table.add_row(
+            add_row(
                 str(layer.layer_number),
                 layer.layer_name,
                 f"{layer.score:.2%}",
-                status_text,
+                self.PASS_MARK if layer.passed else self.FAIL_MARK,
                 f"{len(layer.metrics)} metrics",
             )
 
-        self.console.print(table)
-        self.console.print()
+        cprint(table)
+        cprint()
 
         # Failed Metrics Details
         failed_layers = result.get_failed_layers()
         if failed_layers:
-            self.console.print("[bold red]Failed Metrics:[/bold red]")
-            self.console.print()
+            cprint("[bold red]Failed Metrics:[/bold red]")
+            cprint()
 
             for layer in failed_layers:
                 failed_metrics = layer.get_failed_metrics()
                 if failed_metrics:
-                    self.console.print(f"  [yellow]Layer {layer.layer_number}: {layer.layer_name}[/yellow]")
+                    cprint(f"  [yellow]Layer {layer.layer_number}: {layer.layer_name}[/yellow]")
 
                     for metric in failed_metrics:
-                        severity_color = {
-                            "critical": "red",
-                            "warning": "yellow",
-                            "info": "blue",
-                        }.get(metric.severity, "white")
+                        severity_color = severity_colors.get(metric.severity, "white")
 
-                        self.console.print(
+                        cprint(
                             f"    [{severity_color}]✗ {metric.metric_name}[/{severity_color}]: "
                             f"Score {metric.score:.2%} (threshold: {metric.threshold:.2%})"
                         )
 
                         if metric.remediation:
-                            self.console.print(f"      Remediation: {metric.remediation}")
+                            cprint(f"      Remediation: {metric.remediation}")
 
-                    self.console.print()
+                    cprint()
 
         # Critical Issues
         if result.critical_issues:
-            self.console.print("[bold red]Critical Issues:[/bold red]")
+            cprint("[bold red]Critical Issues:[/bold red]")
             for issue in result.critical_issues:
-                self.console.print(f"  [red]• {issue}[/red]")
-            self.console.print()
+                cprint(f"  [red]• {issue}[/red]")
+            cprint()
 
     def print_detailed(self, result: EvaluationResult) -> None:
         """Print detailed evaluation results including all metrics.
@@ -113,43 +134,50 @@ class TerminalReporter:
         """
         self.print_summary(result)
 
-        self.console.print("[bold]Detailed Metrics:[/bold]")
-        self.console.print()
+        cprint = self.console.print
+        severity_colors = self.SEVERITY_COLORS
+
+        cprint("[bold]Detailed Metrics:[/bold]")
+        cprint()
 
         for layer in result.layers:
-            self.console.print(f"[bold cyan]Layer {layer.layer_number}: {layer.layer_name}[/bold cyan]")
-            self.console.print(f"Layer Score: {layer.score:.2%}")
-            self.console.print()
+            cprint(f"[bold cyan]Layer {layer.layer_number}: {layer.layer_name}[/bold cyan]")
+            cprint(f"Layer Score: {layer.score:.2%}")
+            cprint()
 
             if layer.metrics:
-                metrics_table = Table(show_header=True, header_style="bold")
-                metrics_table.add_column("Metric", style="white", width=30)
-                metrics_table.add_column("Score", justify="right", width=10)
-                metrics_table.add_column("Threshold", justify="right", width=10)
-                metrics_table.add_column("Status", justify="center", width=10)
-                metrics_table.add_column("Severity", justify="center", width=10)
+                metrics_table = self._make_table(self.METRIC_COLUMNS, header_style="bold")
 
+                add_row = metrics_table.add_row
                 for metric in layer.metrics:
-                    status_icon = "✓" if metric.passed else "✗"
-                    status_color = "green" if metric.passed else "red"
-                    status_text = f"[{status_color}]{status_icon}[/{status_color}]"
-
-                    severity_color = {
-                        "critical": "red",
-                        "warning": "yellow",
-                        "info": "blue",
-                    }.get(metric.severity, "white")
+                    severity_color = severity_colors.get(metric.severity, "white")
 
-                    metrics_table.add_row(
+                    add_row(
                         metric.metric_name,
                         f"{metric.score:.2%}",
                         f"{metric.threshold:.2%}",
-                        status_text,
+                        self.PASS_MARK if metric.passed else self.FAIL_MARK,
                         f"[{severity_color}]{metric.severity}[/{severity_color}]",
                     )
 
-                self.console.print(metrics_table)
+                cprint(metrics_table)
             else:
-                self.console.print("  [dim]No metrics evaluated for this layer[/dim]")
+                cprint("  [dim]No metrics evaluated for this layer[/dim]")
 
-            self.console.print()
+            cprint()
+
+    @staticmethod
+    def _make_table(columns: Tuple[Tuple[str, Dict[str, Any]], ...], **kwargs: Any) -> Table:
+        """Create a table with the given column specs.
+
+        Args:
+            columns: Sequence of (header, column options) pairs
+            **kwargs: Additional arguments passed to Table
+
+        Returns:
+            Fresh Table with all columns added
+        """
+        table = Table(show_header=True, **kwargs)
+        for header, options in columns:
+            table.add_column(header, **options)
+        return table